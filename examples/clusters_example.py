@@ -23,11 +23,18 @@ This example shows how to:
 - Delete a cluster
 """
 
+import asyncio
 import os
+import random
 import time
+from collections.abc import Callable, Hashable
+from typing import TypeVar
+
+import requests
 
 from verda import VerdaClient
 from verda.constants import Actions, ClusterStatus, Locations
+from verda.exceptions import APIException
 
 # Get credentials from environment variables
 CLIENT_ID = os.environ.get('VERDA_CLIENT_ID')
@@ -37,27 +44,103 @@ BASE_URL = os.environ.get('VERDA_BASE_URL', 'https://api.verda.com/v1')
 # Create client
 verda = VerdaClient(CLIENT_ID, CLIENT_SECRET, base_url=BASE_URL)
 
-
-def create_cluster_example():
+T = TypeVar('T')
+
+
+async def _poll_until(
+    fetch: Callable[[], T],
+    predicate: Callable[[T], bool],
+    progress: Callable[[T], Hashable] = lambda result: result.status,
+    min_delay: float = 0.5,
+    max_delay: float = 30.0,
+    factor: float = 2.0,
+    upper_bound: float = 900.0,
+    max_errors: int = 10,
+    initial: T | None = None,
+    waiting_for: str = 'condition',
+) -> T:
+    """Poll `fetch` until `predicate` holds, scheduling polls from observed progress.
+
+    `fetch` is a blocking SDK call and runs in a worker thread, so the event loop isn't
+    blocked while it waits. If an `initial` result is given, it is checked before the
+    first poll, so no request is made when it already satisfies `predicate`.
+
+    `progress` maps a polled result to a value that changes whenever provisioning moves
+    forward. After progress is observed, the next poll is scheduled after as long as
+    the last step took, assuming the next step takes about as long. Without progress
+    the delay grows by `factor`. Delays stay between `min_delay` and `max_delay`, and
+    each sleep is jittered by ±20% so concurrent waiters don't poll in lockstep.
+
+    Failed polls are retried with the same backoff, up to `max_errors` in a row.
+    `waiting_for` describes the awaited state in log and timeout messages.
+
+    Raises:
+        TimeoutError: If `predicate` does not hold within `upper_bound + max_delay` seconds.
+        APIException: If `max_errors` consecutive polls fail with an API error.
+        requests.RequestException: If `max_errors` consecutive polls fail to connect.
+    """
+    deadline = time.monotonic() + upper_bound + max_delay
+    last_progress_at = time.monotonic()
+    delay = min_delay
+    errors = 0
+    result = initial if initial is not None else await asyncio.to_thread(fetch)
+    last_progress = progress(result)
+    while not predicate(result):
+        now = time.monotonic()
+        if now >= deadline:
+            raise TimeoutError(
+                f'Timed out waiting for {waiting_for}: not done within {upper_bound:.0f}s'
+                f' (+{max_delay:.0f}s for a final poll), last state: {last_progress}'
+            )
+
+        print(f'Waiting for {waiting_for}... ({last_progress}, next poll in {delay:.1f}s)')
+        await asyncio.sleep(min(delay * random.uniform(0.8, 1.2), deadline - now))
+        try:
+            result = await asyncio.to_thread(fetch)
+        except (APIException, requests.RequestException) as e:
+            errors += 1
+            if errors >= max_errors:
+                raise
+            print(f'Poll failed ({errors}/{max_errors}): {e}')
+            delay = min(delay * factor, max_delay)
+            continue
+        errors = 0
+
+        now = time.monotonic()
+        current_progress = progress(result)
+        if current_progress != last_progress:
+            delay = min(max(now - last_progress_at, min_delay), max_delay)
+            last_progress, last_progress_at = current_progress, now
+        else:
+            delay = min(delay * factor, max_delay)
+    return result
+
+
+async def create_cluster_example():
     """Create a new compute cluster."""
-    # Get SSH keys
-    ssh_keys = [key.id for key in verda.ssh_keys.get()]
-
     cluster_type = '16B200'
     cluster_image = 'ubuntu-24.04-cuda-13.0-cluster'
     location_code = Locations.FIN_03
 
+    # Get all SSH keys
+    ssh_keys = [key.id for key in await asyncio.to_thread(verda.ssh_keys.get)]
+
+    # Fetch cluster type availability and supported images. The client isn't
+    # thread-safe, so the SDK calls run one at a time, off the event loop
+    available = await asyncio.to_thread(verda.clusters.is_available, cluster_type, location_code)
+    images = await asyncio.to_thread(verda.clusters.get_cluster_images, cluster_type)
+
     # Check if cluster type is available
-    if not verda.clusters.is_available(cluster_type, location_code):
+    if not available:
         raise ValueError(f'Cluster type {cluster_type} is not available in {location_code}')
 
-    # Get available images for cluster type
-    images = verda.clusters.get_cluster_images(cluster_type)
+    # Check if cluster image is supported for cluster type
     if cluster_image not in images:
         raise ValueError(f'Cluster image {cluster_image} is not supported for {cluster_type}')
 
     # Create a cluster
-    cluster = verda.clusters.create(
+    cluster = await asyncio.to_thread(
+        verda.clusters.create,
         hostname='my-compute-cluster',
         cluster_type=cluster_type,
         image=cluster_image,
@@ -76,10 +159,14 @@ def create_cluster_example():
     print(f'Location: {cluster.location}')
 
     # Wait for cluster to enter RUNNING status
-    while cluster.status != ClusterStatus.RUNNING:
-        print(f'Waiting for cluster to enter RUNNING status... (status: {cluster.status})')
-        time.sleep(3)
-        cluster = verda.clusters.get_by_id(cluster.id)
+    print('Waiting for cluster to enter RUNNING status...')
+    cluster = await _poll_until(
+        lambda: verda.clusters.get_by_id(cluster.id),
+        lambda c: c.status == ClusterStatus.RUNNING,
+        progress=lambda c: (c.status, len(c.worker_nodes), c.ip),
+        initial=cluster,
+        waiting_for=f'cluster {cluster.id} to reach {ClusterStatus.RUNNING}',
+    )
 
     print(f'Public IP: {cluster.ip}')
     print('Cluster is now running and ready to use!')
@@ -87,27 +174,27 @@ def create_cluster_example():
     return cluster
 
 
-def list_clusters_example():
+async def list_clusters_example():
     """List all clusters."""
     # Get all clusters
-    clusters = verda.clusters.get()
+    clusters = await asyncio.to_thread(verda.clusters.get)
+
+    # Get clusters with specific status
+    running_clusters = await asyncio.to_thread(verda.clusters.get, status=ClusterStatus.RUNNING)
 
     print(f'\nFound {len(clusters)} cluster(s):')
     for cluster in clusters:
         print(
             f'  - {cluster.hostname} ({cluster.id}): {cluster.status} - {len(cluster.worker_nodes)} nodes'
         )
-
-    # Get clusters with specific status
-    running_clusters = verda.clusters.get(status=ClusterStatus.RUNNING)
     print(f'\nFound {len(running_clusters)} running cluster(s)')
 
     return clusters
 
 
-def get_cluster_by_id_example(cluster_id: str):
+async def get_cluster_by_id_example(cluster_id: str):
     """Get a specific cluster by ID."""
-    cluster = verda.clusters.get_by_id(cluster_id)
+    cluster = await asyncio.to_thread(verda.clusters.get_by_id, cluster_id)
 
     print('\nCluster details:')
     print(f'  ID: {cluster.id}')
@@ -137,25 +224,25 @@ def delete_cluster_example(cluster_id: str):
     print('Cluster deleted successfully')
 
 
-def main():
+async def main():
     """Run all cluster examples."""
     print('=== Clusters API Example ===\n')
 
     print('Creating a new cluster...')
-    cluster = create_cluster_example()
+    cluster = await create_cluster_example()
     cluster_id = cluster.id
 
     print('\nListing all clusters...')
-    list_clusters_example()
+    await list_clusters_example()
 
     print('\nGetting cluster details...')
-    get_cluster_by_id_example(cluster_id)
+    await get_cluster_by_id_example(cluster_id)
 
     print('\nDeleting the cluster...')
-    delete_cluster_example(cluster_id)
+    await asyncio.to_thread(delete_cluster_example, cluster_id)
 
     print('\n=== Example completed successfully ===')
 
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())
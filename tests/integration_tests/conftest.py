@@ -30,6 +30,7 @@ CLIENT_ID = os.getenv('VERDA_CLIENT_ID')
 BASE_URL = os.getenv('VERDA_BASE_URL', 'http://localhost:3010/v1')
 
 
-@pytest.fixture
+# Shared by all tests, so authentication and connection setup happen once per run
+@pytest.fixture(scope='session')
 def verda_client():
     return VerdaClient(CLIENT_ID, CLIENT_SECRET, BASE_URL)
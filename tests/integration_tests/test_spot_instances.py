@@ -53,8 +53,14 @@ class TestInstances:
         assert instance.id is not None
         assert instance.status == verda_client.constants.instance_status.PROVISIONING
 
+        # wait for the instance to be running, doubling the poll interval up to 30s
+        deadline = time.monotonic() + 900
+        delay = 1.0
         while instance.status != verda_client.constants.instance_status.RUNNING:
-            time.sleep(2)
+            if time.monotonic() >= deadline:
+                pytest.fail(f'Instance {instance.id} is not running, status={instance.status}')
+            time.sleep(delay)
+            delay = min(delay * 2, 30)
             logger.debug('Waiting for instance to be running... %s', instance.status)
             instance = verda_client.instances.get_by_id(instance.id)
 
@@ -20,6 +20,7 @@ from responses import matchers
 
 from verda.authentication import AuthenticationService
 from verda.exceptions import APIException
+from verda.http_client import DEFAULT_TIMEOUT
 
 INVALID_REQUEST = 'invalid_request'
 INVALID_REQUEST_MESSAGE = 'Your existence is invalid'
@@ -73,6 +74,7 @@ class TestAuthenticationService:
         assert authentication_service._token_type == TOKEN_TYPE
         assert authentication_service._expires_at is not None
         assert responses.assert_call_count(endpoint, 1) is True
+        assert responses.calls[0].request.req_kwargs['timeout'] == DEFAULT_TIMEOUT
 
     def test_authenticate_failed(self, authentication_service, endpoint):
         # arrange - add response mock
@@ -14,9 +14,11 @@
 
 import pytest
 import responses  # https://github.com/getsentry/responses
+from responses import matchers
 
 from verda.clusters import Cluster, ClustersService, ClusterWorkerNode
-from verda.constants import ErrorCodes, Locations
+from verda.clusters._clusters import CATALOG_CACHE_TTL
+from verda.constants import ClusterStatus, ErrorCodes, Locations
 from verda.exceptions import APIException
 
 INVALID_REQUEST = ErrorCodes.INVALID_REQUEST
@@ -34,6 +36,7 @@ CLUSTER_LOCATION = Locations.FIN_03
 CLUSTER_IMAGE = 'ubuntu-22.04-cuda-12.4-cluster'
 CLUSTER_CREATED_AT = '2024-01-01T00:00:00Z'
 CLUSTER_IP = '10.0.0.1'
+CLUSTER_AVAILABILITIES = ['16H200', '16B200']
 
 NODE_1_ID = 'node1-c0de-a5d2-4972-ae4e-d429115d055b'
 NODE_2_ID = 'node2-c0de-a5d2-4972-ae4e-d429115d055b'
@@ -106,6 +109,24 @@ class TestClustersService:
         assert cluster.ip == CLUSTER_IP
         assert responses.assert_call_count(endpoint, 1) is True
 
+    def test_get_clusters_by_status(self, clusters_service, endpoint):
+        # arrange - add response mock
+        responses.add(
+            responses.GET,
+            endpoint,
+            json=CLUSTER_PAYLOAD,
+            status=200,
+            match=[matchers.query_param_matcher({'status': CLUSTER_STATUS})],
+        )
+
+        # act
+        clusters = clusters_service.get(status=CLUSTER_STATUS)
+
+        # assert
+        assert len(clusters) == 1
+        assert clusters[0].status == CLUSTER_STATUS
+        assert len(responses.calls) == 1
+
     def test_create_cluster_successful(self, clusters_service, endpoint):
         # arrange - add response mock
         # create cluster
@@ -139,30 +160,86 @@ class TestClustersService:
         assert responses.assert_call_count(endpoint, 1) is True
         assert responses.assert_call_count(url, 1) is True
 
-    def test_create_cluster_failed(self, clusters_service, endpoint):
+    def test_create_cluster_waits_for_retry_after(self, clusters_service, endpoint, monkeypatch):
         # arrange - add response mock
         responses.add(
             responses.POST,
             endpoint,
-            json={'code': INVALID_REQUEST, 'message': INVALID_REQUEST_MESSAGE},
-            status=400,
+            json={'id': CLUSTER_ID},
+            headers={'Retry-After': '5'},
+            status=200,
+        )
+        url = endpoint + '/' + CLUSTER_ID
+        responses.add(responses.GET, url, json=CLUSTER_PAYLOAD[0], status=200)
+        sleeps = []
+        monkeypatch.setattr('verda.clusters._clusters.time.sleep', sleeps.append)
+
+        # act
+        cluster = clusters_service.create(
+            hostname=CLUSTER_HOSTNAME,
+            cluster_type=CLUSTER_CLUSTER_TYPE,
+            image=CLUSTER_IMAGE,
+            wait_for_status=CLUSTER_STATUS,
+        )
+
+        # assert
+        assert cluster.status == CLUSTER_STATUS
+        assert sleeps == [5.0]
+        assert responses.assert_call_count(url, 1) is True
+
+    def test_create_cluster_status_already_reached(self, clusters_service, endpoint, monkeypatch):
+        # arrange - add response mock
+        responses.add(
+            responses.POST,
+            endpoint,
+            json={'id': CLUSTER_ID, 'status': CLUSTER_STATUS},
+            headers={'Retry-After': '5'},
+            status=200,
+        )
+        url = endpoint + '/' + CLUSTER_ID
+        responses.add(responses.GET, url, json=CLUSTER_PAYLOAD[0], status=200)
+        sleeps = []
+        monkeypatch.setattr('verda.clusters._clusters.time.sleep', sleeps.append)
+
+        # act
+        cluster = clusters_service.create(
+            hostname=CLUSTER_HOSTNAME,
+            cluster_type=CLUSTER_CLUSTER_TYPE,
+            image=CLUSTER_IMAGE,
+            wait_for_status=CLUSTER_STATUS,
         )
 
+        # assert
+        assert cluster.status == CLUSTER_STATUS
+        assert sleeps == []
+        assert responses.assert_call_count(url, 1) is True
+
+    @pytest.mark.parametrize(
+        ('status', 'message'),
+        [
+            (ClusterStatus.ERROR, f'Cluster {CLUSTER_ID} entered error state'),
+            (ClusterStatus.DISCONTINUED, f'Cluster {CLUSTER_ID} was discontinued'),
+        ],
+    )
+    def test_create_cluster_failed_status(self, clusters_service, endpoint, status, message):
+        # arrange - add response mock
+        responses.add(responses.POST, endpoint, json={'id': CLUSTER_ID}, status=200)
+        url = endpoint + '/' + CLUSTER_ID
+        responses.add(responses.GET, url, json={**CLUSTER_PAYLOAD[0], 'status': status}, status=200)
+
         # act
         with pytest.raises(APIException) as excinfo:
             clusters_service.create(
                 hostname=CLUSTER_HOSTNAME,
                 cluster_type=CLUSTER_CLUSTER_TYPE,
                 image=CLUSTER_IMAGE,
-                description=CLUSTER_DESCRIPTION,
-                ssh_key_ids=[SSH_KEY_ID],
-                location=CLUSTER_LOCATION,
+                wait_for_status=ClusterStatus.RUNNING,
             )
 
         # assert
-        assert excinfo.value.code == INVALID_REQUEST
-        assert excinfo.value.message == INVALID_REQUEST_MESSAGE
-        assert responses.assert_call_count(endpoint, 1) is True
+        assert excinfo.value.code == ErrorCodes.SERVER_ERROR
+        assert excinfo.value.message == message
+        assert responses.assert_call_count(url, 1) is True
 
     def test_delete_cluster_successful(self, clusters_service, endpoint):
         # arrange - add response mock
@@ -175,20 +252,154 @@ class TestClustersService:
         assert result is None
         assert responses.assert_call_count(endpoint, 1) is True
 
-    def test_delete_cluster_failed(self, clusters_service, endpoint):
+    @pytest.mark.parametrize(
+        ('method', 'path', 'call'),
+        [
+            (responses.GET, '', lambda service: service.get()),
+            (responses.GET, '/' + CLUSTER_ID, lambda service: service.get_by_id(CLUSTER_ID)),
+            (
+                responses.POST,
+                '',
+                lambda service: service.create(
+                    hostname=CLUSTER_HOSTNAME,
+                    cluster_type=CLUSTER_CLUSTER_TYPE,
+                    image=CLUSTER_IMAGE,
+                    description=CLUSTER_DESCRIPTION,
+                    ssh_key_ids=[SSH_KEY_ID],
+                    location=CLUSTER_LOCATION,
+                ),
+            ),
+            (responses.PUT, '', lambda service: service.delete('invalid_id')),
+        ],
+        ids=['get', 'get_by_id', 'create', 'delete'],
+    )
+    def test_request_failed(self, clusters_service, endpoint, method, path, call):
         # arrange - add response mock
+        url = endpoint + path
         responses.add(
-            responses.PUT,
-            endpoint,
+            method,
+            url,
             json={'code': INVALID_REQUEST, 'message': INVALID_REQUEST_MESSAGE},
             status=400,
         )
 
         # act
         with pytest.raises(APIException) as excinfo:
-            clusters_service.delete('invalid_id')
+            call(clusters_service)
 
         # assert
         assert excinfo.value.code == INVALID_REQUEST
         assert excinfo.value.message == INVALID_REQUEST_MESSAGE
-        assert responses.assert_call_count(endpoint, 1) is True
+        assert responses.assert_call_count(url, 1) is True
+
+    def test_get_availabilities_cached(self, clusters_service, http_client):
+        # arrange - add response mock
+        url = http_client._base_url + '/cluster-availability'
+        responses.add(
+            responses.GET,
+            url,
+            json=[{'location_code': CLUSTER_LOCATION, 'availabilities': CLUSTER_AVAILABILITIES}],
+            status=200,
+            match=[matchers.query_param_matcher({'location_code': CLUSTER_LOCATION})],
+        )
+
+        # act
+        first = clusters_service.get_availabilities(CLUSTER_LOCATION)
+        second = clusters_service.get_availabilities(CLUSTER_LOCATION)
+
+        # assert
+        assert first == CLUSTER_AVAILABILITIES
+        assert second == CLUSTER_AVAILABILITIES
+        assert len(responses.calls) == 1
+
+    def test_get_availabilities_cache_expired(self, clusters_service, http_client, monkeypatch):
+        # arrange - add response mock
+        url = http_client._base_url + '/cluster-availability'
+        responses.add(
+            responses.GET,
+            url,
+            json=[{'location_code': CLUSTER_LOCATION, 'availabilities': CLUSTER_AVAILABILITIES}],
+            status=200,
+        )
+        now = [1000.0]
+        monkeypatch.setattr('verda.clusters._clusters.time.monotonic', lambda: now[0])
+
+        # act
+        clusters_service.get_availabilities(CLUSTER_LOCATION)
+        now[0] += CATALOG_CACHE_TTL - 1
+        clusters_service.get_availabilities(CLUSTER_LOCATION)
+        now[0] += 1
+        availabilities = clusters_service.get_availabilities(CLUSTER_LOCATION)
+
+        # assert
+        assert availabilities == CLUSTER_AVAILABILITIES
+        assert len(responses.calls) == 2
+
+    def test_get_availabilities_empty(self, clusters_service, http_client):
+        # arrange - add response mock
+        url = http_client._base_url + '/cluster-availability'
+        responses.add(responses.GET, url, json=[], status=200)
+
+        # act
+        availabilities = clusters_service.get_availabilities(CLUSTER_LOCATION)
+
+        # assert
+        assert availabilities == []
+
+    def test_is_available(self, clusters_service, http_client):
+        # arrange - add response mock
+        url = http_client._base_url + '/cluster-availability/' + CLUSTER_CLUSTER_TYPE
+        responses.add(
+            responses.GET,
+            url,
+            body='false',
+            status=200,
+            match=[matchers.query_param_matcher({'location_code': CLUSTER_LOCATION})],
+        )
+
+        # act
+        is_available = clusters_service.is_available(CLUSTER_CLUSTER_TYPE, CLUSTER_LOCATION)
+
+        # assert
+        assert is_available is False
+        assert len(responses.calls) == 1
+
+    def test_get_cluster_images_cached(self, clusters_service, http_client):
+        # arrange - add response mock
+        url = http_client._base_url + '/images/cluster'
+        responses.add(
+            responses.GET,
+            url,
+            json=[{'image_type': CLUSTER_IMAGE}],
+            status=200,
+            match=[matchers.query_param_matcher({'instance_type': CLUSTER_CLUSTER_TYPE})],
+        )
+
+        # act
+        first = clusters_service.get_cluster_images(CLUSTER_CLUSTER_TYPE)
+        second = clusters_service.get_cluster_images(CLUSTER_CLUSTER_TYPE)
+
+        # assert
+        assert first == [CLUSTER_IMAGE]
+        assert second == [CLUSTER_IMAGE]
+        assert len(responses.calls) == 1
+
+    def test_refresh_catalog(self, clusters_service, http_client):
+        # arrange - add response mock
+        url = http_client._base_url + '/images/cluster'
+        responses.add(
+            responses.GET,
+            url,
+            json=[{'image_type': CLUSTER_IMAGE}],
+            status=200,
+            match=[matchers.query_param_matcher({'instance_type': CLUSTER_CLUSTER_TYPE})],
+        )
+
+        # act
+        clusters_service.get_cluster_images(CLUSTER_CLUSTER_TYPE)
+        clusters_service.refresh_catalog()
+        images = clusters_service.get_cluster_images(CLUSTER_CLUSTER_TYPE)
+
+        # assert
+        assert images == [CLUSTER_IMAGE]
+        assert len(responses.calls) == 2
@@ -18,6 +18,7 @@ import pytest
 import responses  # https://github.com/getsentry/responses
 
 from verda.exceptions import APIException
+from verda.http_client._http_client import DEFAULT_TIMEOUT
 
 INVALID_REQUEST = 'invalid_request'
 INVALID_REQUEST_MESSAGE = 'Your existence is invalid'
@@ -212,3 +213,27 @@ class TestHttpClient:
         # assert
         assert excinfo.value.code == INVALID_REQUEST
         assert excinfo.value.message == INVALID_REQUEST_MESSAGE
+
+    def test_requests_reuse_session(self, http_client):
+        # arrange - add response mock
+        url = http_client._base_url + '/test'
+        responses.add(method=responses.GET, url=url, status=200, body='{}')
+        responses.add(method=responses.PUT, url=url, status=502, body='{}')
+        session = http_client._session
+
+        # act
+        http_client.get('/test')
+        http_client.get('/test')
+        with pytest.raises(APIException):
+            http_client.put('/test', json={'action': 'delete'})
+
+        # assert
+        adapter = session.get_adapter(url)
+        assert http_client._session is session
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert not adapter.max_retries.is_retry('PUT', 502)
+        assert adapter.max_retries.is_retry('GET', 502)
+        assert responses.calls[2].request.method == responses.PUT
+        assert len(responses.calls) == 3
+        assert responses.calls[0].request.req_kwargs['timeout'] == DEFAULT_TIMEOUT
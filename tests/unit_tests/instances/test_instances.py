@@ -403,6 +403,35 @@ class TestInstancesService:
             responses.assert_call_count(get_instance_url, expected_get_instance_call_count) is True
         )
 
+    def test_create_wait_backoff(self, instances_service, endpoint, monkeypatch):
+        # arrange - add response mock
+        responses.add(responses.POST, endpoint, body=INSTANCE_ID, status=200)
+        get_instance_url = endpoint + '/' + INSTANCE_ID
+        for status in [InstanceStatus.ORDERED] * 3 + [InstanceStatus.RUNNING]:
+            payload = copy.deepcopy(PAYLOAD[0])
+            payload['status'] = status
+            responses.add(responses.GET, get_instance_url, json=payload, status=200)
+        sleeps = []
+        monkeypatch.setattr('verda.instances._instances.time.sleep', sleeps.append)
+
+        # act
+        instance = instances_service.create(
+            instance_type=INSTANCE_TYPE,
+            image=OS_VOLUME_ID,
+            hostname=INSTANCE_HOSTNAME,
+            description=INSTANCE_DESCRIPTION,
+            wait_for_status=InstanceStatus.RUNNING,
+            initial_interval=1,
+            max_interval=3,
+            backoff_coefficient=2,
+            max_wait_time=100,
+        )
+
+        # assert
+        assert instance.status == InstanceStatus.RUNNING
+        assert sleeps == [1, 2, 3]
+        assert responses.assert_call_count(get_instance_url, 4) is True
+
     def test_create_instance_failed(self, instances_service, endpoint):
         # arrange - add response mock
         responses.add(
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from verda.helpers import strip_none_values
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from verda.helpers import parse_retry_after, strip_none_values
 
 
 def test_strip_none_values_removes_none_recursively():
@@ -39,3 +42,13 @@ def test_strip_none_values_removes_none_recursively():
             ['value', None],
         ],
     }
+
+
+def test_parse_retry_after():
+    in_a_minute = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+
+    assert parse_retry_after('5') == 5.0
+    assert parse_retry_after('-1') == 0.0
+    assert 55 < parse_retry_after(in_a_minute) <= 60
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
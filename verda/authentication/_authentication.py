@@ -16,7 +16,7 @@ import time
 
 import requests
 
-from verda.http_client import handle_error
+from verda.http_client import DEFAULT_TIMEOUT, handle_error
 
 TOKEN_ENDPOINT = '/oauth2/token'
 
@@ -31,6 +31,8 @@ class AuthenticationService:
         self._base_url = base_url
         self._client_id = client_id
         self._client_secret = client_secret
+        # Token requests reuse one connection and never wait on the server indefinitely
+        self._session = requests.Session()
 
     def authenticate(self) -> dict:
         """Authenticate the client and store the access & refresh tokens.
@@ -54,7 +56,9 @@ class AuthenticationService:
             'client_secret': self._client_secret,
         }
 
-        response = requests.post(url, json=payload, headers=self._generate_headers())
+        response = self._session.post(
+            url, json=payload, headers=self._generate_headers(), timeout=DEFAULT_TIMEOUT
+        )
         handle_error(response)
 
         auth_data = response.json()
@@ -87,7 +91,9 @@ class AuthenticationService:
 
         payload = {'grant_type': REFRESH_TOKEN, 'refresh_token': self._refresh_token}
 
-        response = requests.post(url, json=payload, headers=self._generate_headers())
+        response = self._session.post(
+            url, json=payload, headers=self._generate_headers(), timeout=DEFAULT_TIMEOUT
+        )
 
         # if refresh token is also expired, authenticate again:
         if response.status_code == 401 or response.status_code == 400:
@@ -12,14 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import itertools
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import TypeVar
 
 from dataclasses_json import dataclass_json
 
 from verda.constants import Actions, ClusterStatus, ErrorCodes, Locations
 from verda.exceptions import APIException
+from verda.helpers import parse_retry_after
 from verda.http_client import HTTPClient
 
 CLUSTERS_ENDPOINT = '/clusters'
@@ -27,6 +29,17 @@ CLUSTERS_ENDPOINT = '/clusters'
 # Default shared volume size is 30TB
 DEFAULT_SHARED_VOLUME_SIZE = 30000
 
+# Cluster availabilities and images change on the order of minutes, so they are cached briefly
+CATALOG_CACHE_TTL = 60
+
+# Statuses a cluster can't leave while being created, mapped to the error message to raise
+FAILED_STATUS_MESSAGES = {
+    ClusterStatus.ERROR: 'entered error state',
+    ClusterStatus.DISCONTINUED: 'was discontinued',
+}
+
+T = TypeVar('T')
+
 
 @dataclass_json
 @dataclass
@@ -113,6 +126,26 @@ class ClustersService:
             http_client: HTTP client for making API requests.
         """
         self._http_client = http_client
+        self._catalog_cache: dict[tuple, tuple[float, object]] = {}
+
+    def _get_cached(self, key: tuple, fetch: Callable[[], T]) -> T:
+        """Returns the cached value for key, calling fetch if it is missing or expired.
+
+        Args:
+            key: Cache key, the method name followed by its arguments.
+            fetch: Function that retrieves the value from the API.
+
+        Returns:
+            The cached or freshly fetched value.
+        """
+        now = time.monotonic()
+        cached = self._catalog_cache.get(key)
+        if cached is not None and now - cached[0] < CATALOG_CACHE_TTL:
+            return cached[1]
+
+        value = fetch()
+        self._catalog_cache[key] = (now, value)
+        return value
 
     def get(self, status: str | None = None) -> list[Cluster]:
         """Retrieves all clusters or clusters with specific status.
@@ -176,6 +209,7 @@ class ClustersService:
             shared_volume_size: Optional size for the shared volume, in GB, default to 30TB.
             wait_for_status: Status to wait for the cluster to reach, default to PROVISIONING. If None, no wait is performed.
             max_wait_time: Maximum total wait for the cluster to start creating, in seconds (default: 900)
+                If the create response has a Retry-After header, the first status check waits for it.
             initial_interval: Initial interval, in seconds (default: 1.0)
             max_interval: The longest single delay allowed between retries, in seconds (default: 10)
             backoff_coefficient: Coefficient to calculate the next retry interval (default 2.0)
@@ -201,25 +235,31 @@ class ClustersService:
                 'size': shared_volume_size if shared_volume_size else DEFAULT_SHARED_VOLUME_SIZE,
             },
         }
-        response = self._http_client.post(CLUSTERS_ENDPOINT, json=payload).json()
-        id = response['id']
+        response = self._http_client.post(CLUSTERS_ENDPOINT, json=payload)
+        created = response.json()
+        id = created['id']
 
-        if not wait_for_status:
+        # No need to wait if the status was not requested or is already reached
+        if not wait_for_status or created.get('status') == wait_for_status:
             return self.get_by_id(id)
 
         # Wait for cluster to enter creating state with timeout
         # TODO(shamrin) extract backoff logic, _instances module has the same code
         deadline = time.monotonic() + max_wait_time
-        for i in itertools.count():
+        interval = min(initial_interval, max_interval)
+
+        # Don't poll before the time the API expects the cluster to be ready
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if retry_after:
+            time.sleep(min(retry_after, max_wait_time))
+        while True:
             cluster = self.get_by_id(id)
             if cluster.status == wait_for_status:
                 return cluster
 
-            if cluster.status == ClusterStatus.ERROR:
-                raise APIException(ErrorCodes.SERVER_ERROR, f'Cluster {id} entered error state')
-
-            if cluster.status == ClusterStatus.DISCONTINUED:
-                raise APIException(ErrorCodes.SERVER_ERROR, f'Cluster {id} was discontinued')
+            failure = FAILED_STATUS_MESSAGES.get(cluster.status)
+            if failure:
+                raise APIException(ErrorCodes.SERVER_ERROR, f'Cluster {id} {failure}')
 
             now = time.monotonic()
             if now >= deadline:
@@ -227,8 +267,8 @@ class ClustersService:
                     f'Cluster {id} did not enter creating state within {max_wait_time:.1f} seconds'
                 )
 
-            interval = min(initial_interval * backoff_coefficient**i, max_interval, deadline - now)
-            time.sleep(interval)
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * backoff_coefficient, max_interval)
 
     def action(self, id_list: list[str] | str, action: str) -> None:
         """Performs an action on one or more clusters.
@@ -283,16 +323,28 @@ class ClustersService:
     def get_availabilities(self, location_code: str | None = None) -> list[str]:
         """Retrieves a list of available cluster types across locations.
 
+        Results are cached for `CATALOG_CACHE_TTL` seconds.
+
         Args:
             location_code: Optional datacenter location code to filter by.
 
         Returns:
             List of available cluster types and their details.
         """
-        query_params = {'location_code': location_code}
-        response = self._http_client.get('/cluster-availability', params=query_params).json()
-        availabilities = response[0]['availabilities']
-        return availabilities
+
+        def fetch() -> list[str]:
+            query_params = {'location_code': location_code}
+            response = self._http_client.get('/cluster-availability', params=query_params).json()
+            return response[0].get('availabilities', []) if response else []
+
+        return list(self._get_cached(('availabilities', location_code), fetch))
+
+    def refresh_catalog(self) -> None:
+        """Clears the cached cluster availabilities and images.
+
+        The next availability or image lookup fetches fresh data from the API.
+        """
+        self._catalog_cache.clear()
 
     def get_cluster_images(
         self,
@@ -300,12 +352,18 @@ class ClustersService:
     ) -> list[str]:
         """Retrieves a list of available images for a given cluster type (optional).
 
+        Results are cached for `CATALOG_CACHE_TTL` seconds.
+
         Args:
             cluster_type: Type of cluster to get images for.
 
         Returns:
             List of available images for the given cluster type.
         """
-        query_params = {'instance_type': cluster_type}
-        images = self._http_client.get('/images/cluster', params=query_params).json()
-        return [image['image_type'] for image in images]
+
+        def fetch() -> list[str]:
+            query_params = {'instance_type': cluster_type}
+            images = self._http_client.get('/images/cluster', params=query_params).json()
+            return [image['image_type'] for image in images]
+
+        return list(self._get_cached(('cluster_images', cluster_type), fetch))
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import json
+import time
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 
@@ -39,3 +41,21 @@ def strip_none_values(data: Any) -> Any:
     if isinstance(data, list):
         return [strip_none_values(item) for item in data]
     return data
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header value into the number of seconds to wait.
+
+    The header holds either a number of seconds or an HTTP date.
+    Returns ``None`` if the value is missing or can't be parsed.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
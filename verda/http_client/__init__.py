@@ -1 +1 @@
-from ._http_client import HTTPClient, handle_error
+from ._http_client import DEFAULT_TIMEOUT, HTTPClient, handle_error
@@ -15,10 +15,15 @@
 import json
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from verda._version import __version__
 from verda.exceptions import APIException
 
+# (connect, read) timeouts in seconds, used unless a request passes its own timeout
+DEFAULT_TIMEOUT = (10, 120)
+
 
 def handle_error(response: requests.Response) -> None:
     """Checks for the response status code and raises an exception if it's 400 or higher.
@@ -45,6 +50,7 @@ class HTTPClient:
         self._version = __version__
         self._base_url = base_url
         self._auth_service = auth_service
+        self._session = self._create_session()
         self._auth_service.authenticate()
 
     def post(
@@ -52,7 +58,7 @@ class HTTPClient:
     ) -> requests.Response:
         """Sends a POST request.
 
-        A wrapper for the requests.post method.
+        A wrapper for the requests.Session.post method.
 
         Builds the url, uses custom headers, refresh tokens if needed.
 
@@ -72,8 +78,9 @@ class HTTPClient:
 
         url = self._add_base_url(url)
         headers = self._generate_headers()
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
 
-        response = requests.post(url, json=json, headers=headers, params=params, **kwargs)
+        response = self._session.post(url, json=json, headers=headers, params=params, **kwargs)
         handle_error(response)
 
         return response
@@ -83,7 +90,7 @@ class HTTPClient:
     ) -> requests.Response:
         """Sends a PUT request.
 
-        A wrapper for the requests.put method.
+        A wrapper for the requests.Session.put method.
 
         Builds the url, uses custom headers, refresh tokens if needed.
 
@@ -103,8 +110,9 @@ class HTTPClient:
 
         url = self._add_base_url(url)
         headers = self._generate_headers()
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
 
-        response = requests.put(url, json=json, headers=headers, params=params, **kwargs)
+        response = self._session.put(url, json=json, headers=headers, params=params, **kwargs)
         handle_error(response)
 
         return response
@@ -112,7 +120,7 @@ class HTTPClient:
     def get(self, url: str, params: dict | None = None, **kwargs) -> requests.Response:
         """Sends a GET request.
 
-        A wrapper for the requests.get method.
+        A wrapper for the requests.Session.get method.
 
         Builds the url, uses custom headers, refresh tokens if needed.
 
@@ -130,8 +138,9 @@ class HTTPClient:
 
         url = self._add_base_url(url)
         headers = self._generate_headers()
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
 
-        response = requests.get(url, params=params, headers=headers, **kwargs)
+        response = self._session.get(url, params=params, headers=headers, **kwargs)
         handle_error(response)
 
         return response
@@ -141,7 +150,7 @@ class HTTPClient:
     ) -> requests.Response:
         """Sends a PATCH request.
 
-        A wrapper for the requests.patch method.
+        A wrapper for the requests.Session.patch method.
 
         Builds the url, uses custom headers, refresh tokens if needed.
 
@@ -161,8 +170,9 @@ class HTTPClient:
 
         url = self._add_base_url(url)
         headers = self._generate_headers()
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
 
-        response = requests.patch(url, json=json, headers=headers, params=params, **kwargs)
+        response = self._session.patch(url, json=json, headers=headers, params=params, **kwargs)
         handle_error(response)
 
         return response
@@ -172,7 +182,7 @@ class HTTPClient:
     ) -> requests.Response:
         """Sends a DELETE request.
 
-        A wrapper for the requests.delete method.
+        A wrapper for the requests.Session.delete method.
 
         Builds the url, uses custom headers, refresh tokens if needed.
 
@@ -192,12 +202,41 @@ class HTTPClient:
 
         url = self._add_base_url(url)
         headers = self._generate_headers()
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
 
-        response = requests.delete(url, headers=headers, json=json, params=params, **kwargs)
+        response = self._session.delete(url, headers=headers, json=json, params=params, **kwargs)
         handle_error(response)
 
         return response
 
+    def _create_session(self) -> requests.Session:
+        """Create the session used for all requests.
+
+        The session keeps connections alive between requests, so polling and
+        consecutive API calls don't pay for a new TCP and TLS handshake each time.
+        Only read-only requests (GET, HEAD, OPTIONS) are retried with backoff on rate limiting
+        and gateway errors, and a timed out read is retried at most once. PUT and DELETE
+        carry non-idempotent actions in this API, so they're never re-sent once they
+        reach the server.
+
+        :return: session with a pooled, retrying adapter mounted
+        :rtype: requests.Session
+        """
+        retries = Retry(
+            total=3,
+            read=1,
+            allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'}),
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     def _refresh_token_if_expired(self) -> None:
         """Refreshes the access token if it expired.
 
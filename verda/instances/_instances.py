@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import itertools
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -226,7 +225,8 @@ class InstancesService:
         # Wait for instance to enter provisioning state with timeout
         # TODO(shamrin) extract backoff logic, _clusters module has the same code
         deadline = time.monotonic() + max_wait_time
-        for i in itertools.count():
+        interval = min(initial_interval, max_interval)
+        while True:
             instance = self.get_by_id(id)
             if callable(wait_for_status):
                 if wait_for_status(instance.status):
@@ -240,8 +240,8 @@ class InstancesService:
                     f'Instance {id} did not enter provisioning state within {max_wait_time:.1f} seconds'
                 )
 
-            interval = min(initial_interval * backoff_coefficient**i, max_interval, deadline - now)
-            time.sleep(interval)
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * backoff_coefficient, max_interval)
 
     def action(
         self,